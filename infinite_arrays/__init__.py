@@ -12,8 +12,11 @@ from .cache import cache, CachedArray
 from .diagonal import InfiniteDiagonal
 from .iqr import (
     InfiniteOperator,
+    DiagonalOperator,
+    TridiagonalOperator,
     iqr_algorithm,
     iqr_spectrum,
+    iqr_algorithm_batch,
     create_diagonal_operator,
     create_tridiagonal_operator,
 )
@@ -45,8 +48,11 @@ __all__ = [
     "CachedArray",
     "InfiniteDiagonal",
     "InfiniteOperator",
+    "DiagonalOperator",
+    "TridiagonalOperator",
     "iqr_algorithm",
     "iqr_spectrum",
+    "iqr_algorithm_batch",
     "create_diagonal_operator",
     "create_tridiagonal_operator",
 ]
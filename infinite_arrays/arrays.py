@@ -2,8 +2,11 @@
 Infinite array types.
 """
 
+import math
 import numpy as np
-from typing import Tuple, Union, Iterator, Optional, Any
+import operator
+from itertools import repeat
+from typing import Callable, Tuple, Union, Iterator, Optional, Any
 from abc import ABC, abstractmethod
 from .ranges import OneToInf, InfUnitRange
 from .infinity import Infinity
@@ -13,10 +16,16 @@ from ._utils import get_infinity, is_infinity
 _INF = get_infinity()
 globals()['∞'] = _INF
 
+# OneToInf is stateless, so every array shares one index range
+_ONE_TO_INF = OneToInf()
+
 
 class InfiniteArray(ABC):
     """Base class for infinite arrays."""
     
+    # '__weakref__' keeps instances usable as weak references despite __slots__
+    __slots__ = ('dtype', '__weakref__')
+    
     def __init__(self, dtype=None):
         self.dtype = dtype or np.float64
     
@@ -59,42 +68,138 @@ class InfiniteArray(ABC):
     
     def __add__(self, other):
         """Element-wise addition."""
-        from .broadcasting import BroadcastArray
-        return BroadcastArray(lambda i: self[i] + other[i] if hasattr(other, '__getitem__') else self[i] + other, self.shape())
+        op = _add_arrays if hasattr(other, '__getitem__') else _add_scalar
+        return _OpBroadcast(op, self, other, self.shape())
     
     def __radd__(self, other):
         return self.__add__(other)
     
     def __sub__(self, other):
         """Element-wise subtraction."""
-        from .broadcasting import BroadcastArray
-        return BroadcastArray(lambda i: self[i] - other[i] if hasattr(other, '__getitem__') else self[i] - other, self.shape())
+        op = _sub_arrays if hasattr(other, '__getitem__') else _sub_scalar
+        return _OpBroadcast(op, self, other, self.shape())
     
     def __rsub__(self, other):
-        from .broadcasting import BroadcastArray
-        return BroadcastArray(lambda i: other - self[i], self.shape())
+        return _OpBroadcast(_rsub_scalar, self, other, self.shape())
     
     def __mul__(self, other):
         """Element-wise multiplication."""
-        from .broadcasting import BroadcastArray
-        return BroadcastArray(lambda i: self[i] * other[i] if hasattr(other, '__getitem__') else self[i] * other, self.shape())
+        op = _mul_arrays if hasattr(other, '__getitem__') else _mul_scalar
+        return _OpBroadcast(op, self, other, self.shape())
     
     def __rmul__(self, other):
         return self.__mul__(other)
     
     def __truediv__(self, other):
         """Element-wise division."""
-        from .broadcasting import BroadcastArray
-        return BroadcastArray(lambda i: self[i] / other[i] if hasattr(other, '__getitem__') else self[i] / other, self.shape())
+        op = _div_arrays if hasattr(other, '__getitem__') else _div_scalar
+        return _OpBroadcast(op, self, other, self.shape())
     
     def __rtruediv__(self, other):
-        from .broadcasting import BroadcastArray
-        return BroadcastArray(lambda i: other / self[i], self.shape())
+        return _OpBroadcast(_rdiv_scalar, self, other, self.shape())
+
+
+# Element kernels for arithmetic between an array `a` and another array `b`
+# or a scalar `c`, evaluated at index i by _OpBroadcast
+def _add_arrays(i, a, b):
+    return a[i] + b[i]
+
+
+def _add_scalar(i, a, c):
+    return a[i] + c
+
+
+def _sub_arrays(i, a, b):
+    return a[i] - b[i]
+
+
+def _sub_scalar(i, a, c):
+    return a[i] - c
+
+
+def _rsub_scalar(i, a, c):
+    return c - a[i]
+
+
+def _mul_arrays(i, a, b):
+    return a[i] * b[i]
+
+
+def _mul_scalar(i, a, c):
+    return a[i] * c
+
 
+def _div_arrays(i, a, b):
+    return a[i] / b[i]
 
-class Ones(InfiniteArray):
+
+def _div_scalar(i, a, c):
+    return a[i] / c
+
+
+def _rdiv_scalar(i, a, c):
+    return c / a[i]
+
+
+class _ConstantArray(InfiniteArray):
+    """
+    Base for arrays holding the same value everywhere.
+    
+    Arithmetic with a scalar or another constant array of the same shape is
+    folded into a new Fill instead of a lazy element-wise broadcast.
+    """
+    
+    __slots__ = ()
+    
+    @abstractmethod
+    def _constant(self) -> Any:
+        """Return the value stored at every index."""
+        pass
+    
+    def _fold(self, other: Any, op: Callable, reflected: bool = False) -> Optional['Fill']:
+        """Apply op to the constants, or return None if other is not constant."""
+        dtypes = [self.dtype]
+        if isinstance(other, _ConstantArray):
+            if other._shape != self._shape:
+                return None
+            dtypes.append(other.dtype)
+            other = other._constant()
+        elif hasattr(other, '__getitem__'):
+            return None
+        value = op(other, self._constant()) if reflected else op(self._constant(), other)
+        # Promote like NumPy would, e.g. an int64 array plus 0.5 becomes float64
+        return Fill(value, self._shape, np.result_type(*dtypes, value))
+    
+    def __add__(self, other):
+        folded = self._fold(other, operator.add)
+        return super().__add__(other) if folded is None else folded
+    
+    def __sub__(self, other):
+        folded = self._fold(other, operator.sub)
+        return super().__sub__(other) if folded is None else folded
+    
+    def __rsub__(self, other):
+        folded = self._fold(other, operator.sub, reflected=True)
+        return super().__rsub__(other) if folded is None else folded
+    
+    def __mul__(self, other):
+        folded = self._fold(other, operator.mul)
+        return super().__mul__(other) if folded is None else folded
+    
+    def __truediv__(self, other):
+        folded = self._fold(other, operator.truediv)
+        return super().__truediv__(other) if folded is None else folded
+    
+    def __rtruediv__(self, other):
+        folded = self._fold(other, operator.truediv, reflected=True)
+        return super().__rtruediv__(other) if folded is None else folded
+
+
+class Ones(_ConstantArray):
     """Infinite array filled with ones."""
     
+    __slots__ = ('_shape', '_ndim', '_indices', '_one')
+    
     def __init__(self, shape: Union[Infinity, Tuple, None] = None, dtype=None):
         if shape is None or is_infinity(shape):
             shape = (_INF,)
@@ -104,26 +209,21 @@ class Ones(InfiniteArray):
         super().__init__(dtype)
         self._shape = shape
         self._ndim = len(shape)
+        self._one = np.dtype(self.dtype).type(1)
         
-        # For 1D case, use OneToInf for indices
-        if self._ndim == 1 and is_infinity(self._shape[0]):
-            self._indices = OneToInf()
-        else:
-            self._indices = OneToInf()  # Default for 1D
+        self._indices = _ONE_TO_INF
     
     def __getitem__(self, key: Union[int, slice, Tuple]) -> Union[float, 'Ones']:
-        if isinstance(key, int):
-            return np.ones(1, dtype=self.dtype)[0]
-        elif isinstance(key, slice):
+        if isinstance(key, slice):
             return self
-        elif isinstance(key, tuple):
-            # Multi-dimensional indexing
-            return np.ones(1, dtype=self.dtype)[0]
-        return np.ones(1, dtype=self.dtype)[0]
+        # Every int or multi-dimensional index maps to the same stored scalar
+        return self._one
     
     def __iter__(self) -> Iterator[float]:
-        while True:
-            yield np.ones(1, dtype=self.dtype)[0]
+        return repeat(self._one)
+    
+    def _constant(self) -> Any:
+        return self._one
     
     def shape(self) -> Tuple:
         return self._shape
@@ -138,9 +238,11 @@ class Ones(InfiniteArray):
         return f"{self.__class__.__name__}{self.shape()}:\n  " + "\n  ".join(items)
 
 
-class Zeros(InfiniteArray):
+class Zeros(_ConstantArray):
     """Infinite array filled with zeros."""
     
+    __slots__ = ('_shape', '_ndim', '_indices', '_zero')
+    
     def __init__(self, shape: Union[Infinity, Tuple, None] = None, dtype=None):
         if shape is None or is_infinity(shape):
             shape = (_INF,)
@@ -150,32 +252,39 @@ class Zeros(InfiniteArray):
         super().__init__(dtype)
         self._shape = shape
         self._ndim = len(shape)
+        self._zero = np.dtype(self.dtype).type(0)
         
-        if self._ndim == 1 and is_infinity(self._shape[0]):
-            self._indices = OneToInf()
-        else:
-            self._indices = OneToInf()
+        self._indices = _ONE_TO_INF
     
     def __getitem__(self, key: Union[int, slice, Tuple]) -> Union[float, 'Zeros']:
-        if isinstance(key, int):
-            return np.zeros(1, dtype=self.dtype)[0]
-        elif isinstance(key, slice):
+        if isinstance(key, slice):
             return self
-        elif isinstance(key, tuple):
-            return np.zeros(1, dtype=self.dtype)[0]
-        return np.zeros(1, dtype=self.dtype)[0]
+        return self._zero
     
     def __iter__(self) -> Iterator[float]:
-        while True:
-            yield np.zeros(1, dtype=self.dtype)[0]
+        return repeat(self._zero)
+    
+    def _constant(self) -> Any:
+        return self._zero
+    
+    def __mul__(self, other):
+        # Zeros times a finite real scalar is still Zeros; inf, nan, complex
+        # and dtype-promoting scalars change the result, so they are folded
+        if (isinstance(other, (int, np.integer)) or (
+                isinstance(other, (float, np.floating)) and math.isfinite(other))) and (
+                np.result_type(self.dtype, other) == self.dtype):
+            return self
+        return super().__mul__(other)
     
     def shape(self) -> Tuple:
         return self._shape
 
 
-class Fill(InfiniteArray):
+class Fill(_ConstantArray):
     """Infinite array filled with a constant value."""
     
+    __slots__ = ('_value', '_shape', '_ndim', '_indices')
+    
     def __init__(self, value: Any, shape: Union[Infinity, Tuple, None] = None, dtype=None):
         if shape is None or is_infinity(shape):
             shape = (_INF,)
@@ -187,10 +296,7 @@ class Fill(InfiniteArray):
         self._shape = shape
         self._ndim = len(shape)
         
-        if self._ndim == 1 and is_infinity(self._shape[0]):
-            self._indices = OneToInf()
-        else:
-            self._indices = OneToInf()
+        self._indices = _ONE_TO_INF
     
     def __getitem__(self, key: Union[int, slice, Tuple]) -> Any:
         if isinstance(key, int):
@@ -202,9 +308,16 @@ class Fill(InfiniteArray):
         return self._value
     
     def __iter__(self) -> Iterator:
-        while True:
-            yield self._value
+        return repeat(self._value)
+    
+    def _constant(self) -> Any:
+        return self._value
     
     def shape(self) -> Tuple:
         return self._shape
 
+
+# Imported last: broadcasting subclasses InfiniteArray, so it can only load
+# once the classes above exist. Binding the names here keeps the import out
+# of the arithmetic operators.
+from .broadcasting import _OpBroadcast  # noqa: E402
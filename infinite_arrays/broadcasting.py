@@ -3,34 +3,63 @@ Broadcasting support for infinite arrays.
 """
 
 import numpy as np
+from functools import partial
 from typing import Callable, Tuple, Union, Iterator, Any
-from .arrays import InfiniteArray
-from .ranges import OneToInf
+from .arrays import InfiniteArray, _ONE_TO_INF
 from ._utils import get_infinity, is_infinity
 
 # Get ∞ from the module's namespace and add to local namespace
 _INF = get_infinity()
 globals()['∞'] = _INF
 
+# Largest block evaluated at once when iterating a BroadcastArray
+_ITER_CHUNK = 4096
+
 
 class BroadcastArray(InfiniteArray):
-    """Lazy broadcasted array that computes values on-demand."""
+    """Lazy broadcasted array that computes values on-demand.
+    
+    With ``vectorized=True`` the element function is also called on whole
+    index arrays when a block is materialized; it must then give the same
+    values as calling it per index. With ``jit=True`` the element function
+    is compiled with numba; it must then be numba-compatible (plain numeric
+    code, no Python objects).
+    """
+    
+    __slots__ = ('_func', '_shape', '_ndim', '_indices', '_vec_func', '_vectorized',
+                 '_scalar_result')
     
-    def __init__(self, func: Callable, shape: Tuple, dtype=None):
+    def __init__(self, func: Callable, shape: Tuple, dtype=None, jit: bool = False,
+                 vectorized: bool = False):
         super().__init__(dtype)
+        self._vec_func = None
+        self._vectorized = vectorized
+        # Whether func(int) returns a plain scalar; None until first int access
+        self._scalar_result = None
+        if jit:
+            try:
+                import numba
+            except ImportError as e:
+                raise ImportError("BroadcastArray(..., jit=True) requires numba") from e
+            # Compiled ufunc over int64 indices, used for bulk materialization
+            signature = numba.from_dtype(np.dtype(self.dtype))(numba.int64)
+            self._vec_func = numba.vectorize([signature], target='parallel')(func)
+            func = numba.njit(func)
         self._func = func
         self._shape = shape
         self._ndim = len(shape) if isinstance(shape, tuple) else 1
         
-        if self._ndim == 1 and (isinstance(shape, tuple) and len(shape) == 1 and is_infinity(shape[0])):
-            self._indices = OneToInf()
-        else:
-            self._indices = OneToInf()
+        self._indices = _ONE_TO_INF
     
     def __getitem__(self, key: Union[int, slice, Tuple]) -> Any:
+        # Fast path once func is known to return scalars: no result unwrapping
+        if type(key) is int and self._scalar_result:
+            return self._func(key)
         if isinstance(key, int):
             # For 1D, key is 0-based index, but we compute based on 1-based position
             result = self._func(key)
+            if self._scalar_result is None:
+                self._scalar_result = isinstance(result, (int, float, complex, np.number))
             if hasattr(result, '__iter__') and not isinstance(result, str):
                 try:
                     return result[0] if len(result) == 1 else result
@@ -38,7 +67,10 @@ class BroadcastArray(InfiniteArray):
                     return result
             return result
         elif isinstance(key, slice):
-            return self
+            if key.stop is None or is_infinity(key.stop):
+                return self
+            # Bounded slice: evaluate the whole segment in one pass
+            return self._evaluate(np.arange(key.start or 0, key.stop, key.step or 1))
         elif isinstance(key, tuple):
             # Multi-dimensional indexing
             if len(key) == 1:
@@ -47,18 +79,90 @@ class BroadcastArray(InfiniteArray):
             return result
         return self._func(key)
     
+    def materialize(self, n: int) -> np.ndarray:
+        """Evaluate the first n elements into a NumPy array."""
+        return self._materialize_range(0, n)
+    
+    def _materialize_range(self, start: int, stop: int) -> np.ndarray:
+        return self._evaluate(np.arange(start, stop))
+    
+    def materialize_2d(self, rows: int, cols: int) -> np.ndarray:
+        """Evaluate the leading rows×cols block of a 2D array."""
+        I, J = np.indices((rows, cols))
+        if self._vectorized:
+            return np.broadcast_to(self._func((I, J)), (rows, cols)).copy()
+        return _infer_dtype(np.frompyfunc(lambda i, j: self._func((i, j)), 2, 1)(I, J))
+    
+    def _evaluate(self, idx: np.ndarray) -> np.ndarray:
+        """Evaluate the element function at an array of indices."""
+        if self._vec_func is not None:
+            return self._vec_func(idx.astype(np.int64, copy=False))
+        if self._vectorized:
+            return np.broadcast_to(self._func(idx), idx.shape).copy()
+        return _infer_dtype(np.frompyfunc(self._func, 1, 1)(idx))
+    
     def __iter__(self) -> Iterator:
+        # Materialize in chunks that grow up to _ITER_CHUNK, so short
+        # iterations (e.g. __repr__) stay cheap
         i = 0
+        chunk = 16
         while True:
             try:
-                yield self.__getitem__(i)
-                i += 1
+                block = self._materialize_range(i, i + chunk)
             except (IndexError, StopIteration):
                 break
-            except Exception as e:
-                # If function fails, stop iteration
-                break
+            # tolist() hands out plain Python values, as func itself returns
+            yield from block.tolist()
+            i += chunk
+            chunk = min(chunk * 2, _ITER_CHUNK)
+        # A chunk ran off the end, e.g. func is only defined on a finite
+        # prefix: continue element by element up to the first IndexError
+        while True:
+            try:
+                value = self.__getitem__(i)
+            except (IndexError, StopIteration):
+                return
+            yield value
+            i += 1
     
     def shape(self) -> Tuple:
         return self._shape
 
+
+def _infer_dtype(values: np.ndarray) -> np.ndarray:
+    """Convert an object array of results to the dtype NumPy infers for them.
+    
+    Results that do not form a plain array of the same shape (sequences,
+    arbitrary objects) are left as an object array.
+    """
+    try:
+        out = np.array(values.tolist())
+    except Exception:
+        return values
+    if out.shape != values.shape or out.dtype == object:
+        return values
+    return out
+
+
+class _OpBroadcast(BroadcastArray):
+    """Lazy element-wise ``op(i, a, b)`` using a shared module-level kernel."""
+    
+    __slots__ = ('_op', '_a', '_b')
+    
+    def __init__(self, op: Callable, a: InfiniteArray, b: Any, shape: Tuple):
+        # A partial of a module-level function rather than a bound method,
+        # so the array does not reference itself through _func
+        super().__init__(partial(_apply_op, op, a, b), shape)
+        self._op = op
+        self._a = a
+        self._b = b
+    
+    def __getitem__(self, key: Union[int, slice, Tuple]) -> Any:
+        if type(key) is int:
+            return self._op(key, self._a, self._b)
+        return super().__getitem__(key)
+
+
+def _apply_op(op: Callable, a: InfiniteArray, b: Any, i: Any) -> Any:
+    """Evaluate ``op(i, a, b)``; bound to its operands by _OpBroadcast."""
+    return op(i, a, b)
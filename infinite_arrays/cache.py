@@ -4,9 +4,8 @@ Caching functionality for infinite arrays to enable mutation.
 
 import numpy as np
 from typing import Dict, Union, Tuple, Iterator, Any, Optional
-from .arrays import InfiniteArray
-from .ranges import OneToInf
-from ._utils import get_infinity, is_infinity
+from .arrays import InfiniteArray, _ONE_TO_INF
+from ._utils import get_infinity
 
 # Get ∞ from the module's namespace and add to local namespace
 _INF = get_infinity()
@@ -16,29 +15,33 @@ globals()['∞'] = _INF
 class CachedArray(InfiniteArray):
     """Cached version of an infinite array that allows mutation."""
     
+    __slots__ = ('_base_array', '_cache', '_written', '_shape', '_ndim', '_indices')
+    
     def __init__(self, array: InfiniteArray, dtype=None):
         super().__init__(dtype or array.dtype)
         self._base_array = array
+        # A plain dict keeps hits on C-level hashing and stores values as
+        # given, so nothing is lost to a dtype cast
         self._cache: Dict[Union[int, Tuple], Any] = {}
+        # Set once anything is assigned, so values may differ from the base
+        self._written = False
         self._shape = array.shape()
         self._ndim = len(self._shape) if isinstance(self._shape, tuple) else 1
         
-        if self._ndim == 1 and (isinstance(self._shape, tuple) and len(self._shape) == 1 and is_infinity(self._shape[0])):
-            self._indices = OneToInf()
-        else:
-            self._indices = OneToInf()
+        self._indices = _ONE_TO_INF
     
     def __getitem__(self, key: Union[int, slice, Tuple]) -> Any:
         # Check cache first
-        if key in self._cache:
-            return self._cache[key]
+        cache = self._cache
+        if key in cache:
+            return cache[key]
         
         # Otherwise get from base array
         value = self._base_array[key]
         
         # Cache it (but don't cache slices)
-        if not isinstance(key, slice):
-            self._cache[key] = value
+        if type(key) is not slice:
+            cache[key] = value
         
         return value
     
@@ -46,18 +49,20 @@ class CachedArray(InfiniteArray):
         """Set an item in the cached array."""
         if isinstance(key, slice):
             raise ValueError("Cannot set slice of infinite array")
+        self._written = True
         self._cache[key] = value
     
     def __iter__(self) -> Iterator:
+        if not self._written and self._ndim == 1:
+            # Nothing overridden: the base array's own iterator is equivalent
+            return iter(self._base_array)
+        return self._iter_cached()
+    
+    def _iter_cached(self) -> Iterator:
         i = 0
         while True:
-            try:
-                yield self.__getitem__(i)
-                i += 1
-            except (IndexError, StopIteration):
-                break
-            except Exception:
-                break
+            yield self.__getitem__(i)
+            i += 1
     
     def shape(self) -> Tuple:
         return self._shape
@@ -16,78 +16,60 @@ globals()['∞'] = _INF
 class InfiniteDiagonal(InfiniteArray):
     """Infinite diagonal matrix with values from a sequence."""
     
+    __slots__ = ('_values', '_shape', '_ndim', '_indices', '_value_iter', '_value_cache',
+                 '_get_value', '_zero')
+    
     def __init__(self, values: Union[Iterator, InfiniteArray], dtype=None):
         super().__init__(dtype)
         self._values = values
         self._shape = (_INF, _INF)
         self._ndim = 2
         self._indices = (OneToInf(), OneToInf())
+        self._zero = np.dtype(self.dtype).type(0)
+        
+        self._value_iter = None
+        self._value_cache = []
         
-        # If values is iterable, create iterator
-        if hasattr(values, '__iter__') and not isinstance(values, InfiniteArray):
+        # Pick the lookup strategy once; _get_value(i) takes a 1-based index
+        if isinstance(values, InfiniteArray):
+            self._get_value = lambda i, v=values: v[i - 1]
+        elif hasattr(values, '__getitem__') and hasattr(values, '__len__'):
+            # Finite sequences (range, list, ndarray) are indexed directly
+            self._get_value = lambda i, v=values: v[i - 1] if 0 < i <= len(v) else 0
+        elif hasattr(values, '__iter__'):
             self._value_iter = iter(values)
-            self._value_cache = {}
+            self._get_value = self._get_iterated_value
         elif hasattr(values, '__getitem__'):
             # For array-like objects, use __getitem__
-            self._value_iter = None
-            self._value_cache = {}
+            self._get_value = lambda i, v=values: v[i - 1]
         else:
             raise TypeError("values must be iterable or array-like")
     
-    def _get_value(self, i: int) -> Any:
-        """Get the i-th diagonal value (1-based)."""
-        if hasattr(self._values, '__getitem__'):
+    def _get_iterated_value(self, i: int) -> Any:
+        """Get the i-th diagonal value (1-based) by advancing the iterator."""
+        idx = i - 1
+        cache = self._value_cache
+        if idx < len(cache):
+            return cache[idx]
+        while len(cache) <= idx:
             try:
-                # Try 0-based indexing
-                return self._values[i - 1]
-            except (IndexError, TypeError):
-                # Try 1-based indexing
-                try:
-                    return self._values[i]
-                except (IndexError, TypeError):
-                    # Fall back to iteration
-                    if i in self._value_cache:
-                        return self._value_cache[i]
-                    if self._value_iter is None:
-                        self._value_iter = iter(self._values)
-                    # Advance to position i
-                    while len(self._value_cache) < i:
-                        try:
-                            val = next(self._value_iter)
-                            self._value_cache[len(self._value_cache) + 1] = val
-                        except StopIteration:
-                            break
-                    return self._value_cache.get(i, 0)
-        else:
-            # Use iteration
-            if i in self._value_cache:
-                return self._value_cache[i]
-            if self._value_iter is None:
-                self._value_iter = iter(self._values)
-            # Advance to position i
-            while len(self._value_cache) < i:
-                try:
-                    val = next(self._value_iter)
-                    self._value_cache[len(self._value_cache) + 1] = val
-                except StopIteration:
-                    return 0
-            return self._value_cache.get(i, 0)
+                cache.append(next(self._value_iter))
+            except StopIteration:
+                return 0
+        return cache[idx]
     
     def __getitem__(self, key: Union[int, Tuple[int, int]]) -> Union[float, 'InfiniteDiagonal']:
-        if isinstance(key, int):
-            # Return diagonal element
-            return self._get_value(key + 1)  # Convert 0-based to 1-based
-        elif isinstance(key, tuple) and len(key) == 2:
+        t = type(key)
+        if t is tuple:
             row, col = key
-            # Diagonal element if row == col
-            if row == col:
-                return self._get_value(row + 1)  # Convert 0-based to 1-based
-            else:
-                # Off-diagonal elements are zero
-                return 0.0
-        elif isinstance(key, slice):
+            # Off-diagonal elements are zero
+            return self._get_value(row + 1) if row == col else self._zero  # Convert 0-based to 1-based
+        if t is int:
+            # Return diagonal element
+            return self._get_value(key + 1)
+        if t is slice:
             return self
-        return 0.0
+        return self._zero
     
     def __iter__(self) -> Iterator:
         # Iterator over rows (each row is itself an iterator)
@@ -105,6 +87,35 @@ class InfiniteDiagonal(InfiniteArray):
     def shape(self) -> Tuple:
         return self._shape
     
+    def _diagonal_values(self, n: int) -> np.ndarray:
+        """Get the first n diagonal values as a NumPy array, with the dtype inferred from them."""
+        values = self._values
+        if isinstance(values, (range, list, tuple, np.ndarray)):
+            # Slice sequences directly; entries past the end are zero
+            head = np.asarray(values[:n])
+            if len(head) == n:
+                return head
+            vals = np.zeros(n, dtype=head.dtype if len(head) else self.dtype)
+            vals[:len(head)] = head
+            return vals
+        return np.asarray([self._get_value(i + 1) for i in range(n)])
+    
+    def to_dense(self, n: int) -> np.ndarray:
+        """
+        Get a dense n×n truncation of the diagonal matrix.
+        
+        Parameters:
+        -----------
+        n : int
+            Size of the truncation
+            
+        Returns:
+        --------
+        np.ndarray
+            n×n matrix with the first n diagonal values
+        """
+        return np.diag(self._diagonal_values(n))
+    
     def __repr__(self) -> str:
         # Show a matrix representation
         rows = []
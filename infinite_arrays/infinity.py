@@ -7,7 +7,21 @@ from typing import Any
 
 
 class Infinity:
-    """Represents infinity for array dimensions."""
+    """Represents infinity for array dimensions.
+    
+    Infinity is a singleton: ``Infinity()`` always returns the same instance,
+    so identity checks (``x is ∞``) are sufficient.
+    """
+    
+    __slots__ = ()
+    
+    _instance = None
+    _HASH = hash(float('inf'))
+    
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super().__new__(cls)
+        return cls._instance
     
     def __repr__(self) -> str:
         return "∞"
@@ -16,13 +30,13 @@ class Infinity:
         return "∞"
     
     def __eq__(self, other: Any) -> bool:
-        return isinstance(other, Infinity)
+        return other is self or isinstance(other, Infinity)
     
     def __ne__(self, other: Any) -> bool:
-        return not isinstance(other, Infinity)
+        return not (other is self or isinstance(other, Infinity))
     
     def __hash__(self) -> int:
-        return hash(float('inf'))
+        return self._HASH
     
     def __lt__(self, other: Any) -> bool:
         return False
@@ -11,7 +11,13 @@ with convergence rates and error control.
 
 import numpy as np
 from typing import Callable, Tuple, Optional, List, Union, Dict, Any
-from scipy.linalg import qr
+import cmath
+import math
+from concurrent.futures import ThreadPoolExecutor
+from scipy.linalg import (
+    cholesky, eig_banded, eigh_tridiagonal, get_blas_funcs, get_lapack_funcs, hessenberg, qr,
+    solve_triangular,
+)
 from .arrays import InfiniteArray
 from ._utils import get_infinity
 from .broadcasting import BroadcastArray
@@ -20,6 +26,16 @@ from .broadcasting import BroadcastArray
 _INF = get_infinity()
 globals()['∞'] = _INF
 
+# Initial and maximum side length of an operator's dense entry cache
+_INITIAL_CACHE = 64
+_MAX_CACHE = 1024
+
+# Truncation sizes from which the O(n²) Givens sweep beats a dense LAPACK QR
+# step despite its per-rotation Python overhead. Complex LAPACK steps cost
+# more, so the crossover comes earlier than for real matrices.
+_GIVENS_MIN_N_REAL = 250
+_GIVENS_MIN_N_COMPLEX = 150
+
 
 class InfiniteOperator:
     """
@@ -29,6 +45,8 @@ class InfiniteOperator:
     For an operator T, T[i, j] gives the (i, j)-th matrix element (0-based indexing).
     """
     
+    __slots__ = ('_matrix_func', '_shape', 'dtype', '_cache_arr', '_filled', '__weakref__')
+    
     def __init__(self, matrix_func: Callable[[int, int], complex], 
                  shape: Tuple = None,
                  dtype=None):
@@ -47,19 +65,53 @@ class InfiniteOperator:
         self._matrix_func = matrix_func
         self._shape = shape if shape is not None else (_INF, _INF)
         self.dtype = dtype or complex
-        self._cache: Dict[Tuple[int, int], complex] = {}
+        # Dense cache of the leading block, allocated on first use and grown
+        # by doubling; _filled marks which entries have been computed
+        self._cache_arr = np.zeros((0, 0), dtype=self.dtype)
+        self._filled = np.zeros((0, 0), dtype=np.bool_)
+    
+    def _ensure_capacity(self, n: int) -> None:
+        """Grow the dense cache so it covers the leading n×n block."""
+        cap = len(self._filled)
+        if n <= cap:
+            return
+        new_cap = max(cap, _INITIAL_CACHE)
+        while new_cap < n:
+            new_cap *= 2
+        pad = ((0, new_cap - cap), (0, new_cap - cap))
+        self._cache_arr = np.pad(self._cache_arr, pad)
+        self._filled = np.pad(self._filled, pad)
     
     def __getitem__(self, key: Tuple[int, int]) -> complex:
         """Get matrix element at position (i, j)."""
         if isinstance(key, tuple) and len(key) == 2:
             i, j = key
-            if (i, j) in self._cache:
-                return self._cache[(i, j)]
+            cap = len(self._filled)
+            if 0 <= i < cap and 0 <= j < cap and self._filled[i, j]:
+                return self._cache_arr[i, j]
             value = self._matrix_func(i, j)
-            self._cache[(i, j)] = value
+            if 0 <= i < _MAX_CACHE and 0 <= j < _MAX_CACHE:
+                self._ensure_capacity(max(i, j) + 1)
+                self._cache_arr[i, j] = value
+                self._filled[i, j] = True
+                return self._cache_arr[i, j]
             return value
         raise IndexError("Index must be a tuple (i, j)")
     
+    def _evaluate(self, I: np.ndarray, J: np.ndarray) -> np.ndarray:
+        """Evaluate matrix_func at arrays of row and column indices."""
+        try:
+            # frompyfunc calls matrix_func from NumPy's object loop with plain
+            # Python ints, skipping np.vectorize's per-call wrapper
+            values = np.frompyfunc(self._matrix_func, 2, 1)(I, J)
+            return values.astype(self.dtype, copy=False)
+        except Exception:
+            pass
+        values = np.zeros(I.shape, dtype=self.dtype)
+        for k in np.ndindex(I.shape):
+            values[k] = self._matrix_func(int(I[k]), int(J[k]))
+        return values
+    
     def get_truncation(self, n: int) -> np.ndarray:
         """
         Get a finite n×n truncation of the operator.
@@ -74,33 +126,217 @@ class InfiniteOperator:
         np.ndarray
             n×n matrix representing the truncation
         """
-        matrix = np.zeros((n, n), dtype=self.dtype)
-        for i in range(n):
-            for j in range(n):
-                matrix[i, j] = self[i, j]
-        return matrix
+        if n > _MAX_CACHE:
+            I, J = np.mgrid[0:n, 0:n]
+            return self._evaluate(I, J)
+        
+        # Only compute entries not already cached by an earlier call
+        self._ensure_capacity(n)
+        missing = ~self._filled[:n, :n]
+        if missing.any():
+            I, J = np.nonzero(missing)
+            self._cache_arr[I, J] = self._evaluate(I, J)
+            self._filled[I, J] = True
+        return self._cache_arr[:n, :n].copy()
     
     def shape(self) -> Tuple:
         """Return the shape of the operator."""
         return self._shape
 
 
+class _Band:
+    """One diagonal band of a structured operator, materialized on demand."""
+    
+    __slots__ = ('_values', '_arr')
+    
+    def __init__(self, values: Union[Callable, np.ndarray, List, None], dtype):
+        self._values = values if callable(values) else None
+        if values is None:
+            self._arr = np.zeros(0, dtype=dtype)
+        elif callable(values):
+            # Grown as entries are requested
+            self._arr = np.zeros(0, dtype=dtype)
+        else:
+            self._arr = np.ascontiguousarray(values, dtype=dtype)
+    
+    def __getitem__(self, i: int) -> Any:
+        if i < len(self._arr):
+            return self._arr[i]
+        if self._values is not None:
+            return self._values(i)
+        # Entries past the end of the given values are zero
+        return 0.0
+    
+    def head(self, n: int) -> np.ndarray:
+        """First n entries as a contiguous array."""
+        arr = self._arr
+        if len(arr) < n:
+            if self._values is not None:
+                extra = [self._values(i) for i in range(len(arr), n)]
+                arr = self._arr = np.concatenate([arr, np.asarray(extra, dtype=arr.dtype)])
+            else:
+                return np.concatenate([arr, np.zeros(n - len(arr), dtype=arr.dtype)])
+        return arr[:n]
+
+
+class DiagonalOperator(InfiniteOperator):
+    """
+    Infinite diagonal operator.
+    
+    Truncations are built directly from the diagonal band without
+    evaluating off-diagonal entries.
+    """
+    
+    __slots__ = ('_diag',)
+    
+    def __init__(self, diagonal_values: Union[Callable, np.ndarray, List], dtype=None):
+        """
+        Initialize a diagonal operator.
+        
+        Parameters:
+        -----------
+        diagonal_values : Callable, np.ndarray, or List
+            If callable, function that returns diagonal value at index i (0-based)
+            If array/list, diagonal values (zero past the end)
+        dtype : type, optional
+            Data type (default: complex)
+        """
+        super().__init__(self._element, dtype=dtype)
+        self._diag = _Band(diagonal_values, self.dtype)
+    
+    def _element(self, i: int, j: int) -> Any:
+        return self._diag[i] if i == j else 0.0
+    
+    def __getitem__(self, key: Tuple[int, int]) -> complex:
+        """Get matrix element at position (i, j)."""
+        if isinstance(key, tuple) and len(key) == 2:
+            return self._element(*key)
+        raise IndexError("Index must be a tuple (i, j)")
+    
+    def get_truncation(self, n: int) -> np.ndarray:
+        """Get a finite n×n truncation of the operator."""
+        matrix = np.zeros((n, n), dtype=self.dtype)
+        np.fill_diagonal(matrix, self._diag.head(n))
+        return matrix
+
+
+class TridiagonalOperator(InfiniteOperator):
+    """
+    Infinite tridiagonal operator.
+    
+    Truncations are filled band by band with a compiled kernel (numba, when
+    installed) instead of evaluating every matrix entry.
+    """
+    
+    __slots__ = ('_main', '_upper', '_lower')
+    
+    def __init__(self, main_diag: Union[Callable, np.ndarray, List],
+                 upper_diag: Union[Callable, np.ndarray, List] = None,
+                 lower_diag: Union[Callable, np.ndarray, List] = None,
+                 dtype=None):
+        """
+        Initialize a tridiagonal operator.
+        
+        Parameters:
+        -----------
+        main_diag : Callable, np.ndarray, or List
+            Main diagonal values
+        upper_diag : Callable, np.ndarray, or List, optional
+            Upper diagonal values, T[i, i+1] (default: zeros)
+        lower_diag : Callable, np.ndarray, or List, optional
+            Lower diagonal values, T[j+1, j] (default: zeros)
+        dtype : type, optional
+            Data type (default: complex)
+        """
+        super().__init__(self._element, dtype=dtype)
+        self._main = _Band(main_diag, self.dtype)
+        self._upper = _Band(upper_diag, self.dtype)
+        self._lower = _Band(lower_diag, self.dtype)
+    
+    def _element(self, i: int, j: int) -> Any:
+        offset = j - i
+        if offset == 0:
+            return self._main[i]
+        if offset == 1:
+            return self._upper[i]
+        if offset == -1:
+            return self._lower[j]
+        return 0.0
+    
+    def __getitem__(self, key: Tuple[int, int]) -> complex:
+        """Get matrix element at position (i, j)."""
+        if isinstance(key, tuple) and len(key) == 2:
+            return self._element(*key)
+        raise IndexError("Index must be a tuple (i, j)")
+    
+    def bands(self, n: int) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Main, upper and lower bands of the n×n truncation."""
+        m = max(n - 1, 0)
+        return self._main.head(n), self._upper.head(m), self._lower.head(m)
+    
+    def get_truncation(self, n: int) -> np.ndarray:
+        """Get a finite n×n truncation of the operator."""
+        matrix = np.zeros((n, n), dtype=self.dtype)
+        main, upper, lower = self.bands(n)
+        _tridiagonal_fill_kernel()(matrix, main, upper, lower, n)
+        return matrix
+
+
+def _fill_tridiagonal(out, main, upper, lower, n):
+    """Write the three bands into out (NumPy fallback for the numba kernel)."""
+    idx = np.arange(n)
+    out[idx, idx] = main
+    out[idx[:-1], idx[:-1] + 1] = upper
+    out[idx[:-1] + 1, idx[:-1]] = lower
+
+
+_fill_kernel = None
+
+
+def _tridiagonal_fill_kernel() -> Callable:
+    """Return the band fill kernel, compiling it with numba on first use if available."""
+    global _fill_kernel
+    if _fill_kernel is None:
+        try:
+            import numba
+        except ImportError:
+            _fill_kernel = _fill_tridiagonal
+        else:
+            # Serial on purpose: the fill is O(n), and iqr_spectrum calls it
+            # from worker threads, where numba's parallel layers are unsafe
+            @numba.njit(cache=True)
+            def fill(out, main, upper, lower, n):
+                for i in range(n):
+                    out[i, i] = main[i]
+                    if i + 1 < n:
+                        out[i, i + 1] = upper[i]
+                        out[i + 1, i] = lower[i]
+            _fill_kernel = fill
+    return _fill_kernel
+
+
 def iqr_algorithm(operator: InfiniteOperator,
                   n: int = 50,
                   max_iter: int = 1000,
                   tol: float = 1e-10,
                   shift: Optional[complex] = None,
-                  compute_eigenvectors: bool = False) -> Dict[str, Any]:
+                  compute_eigenvectors: bool = False,
+                  qr_method: Optional[str] = None) -> Dict[str, Any]:
     """
     Infinite-dimensional QR algorithm for computing spectra.
     
     This implements the IQR algorithm as described in the paper. The algorithm
     works by:
     1. Truncating the infinite operator to a finite n×n matrix
-    2. Applying QR iterations with optional shifts
+    2. Reducing it to upper Hessenberg form and applying QR iterations
+       with optional shifts
     3. Extracting eigenvalues from the converged matrix
     4. Optionally computing eigenvectors
     
+    Diagonal truncations are returned as-is, and symmetric or Hermitian
+    TridiagonalOperators are solved directly with LAPACK's tridiagonal/banded
+    eigensolvers, unless a shift or qr_method is given.
+    
     Parameters:
     -----------
     operator : InfiniteOperator
@@ -115,72 +351,98 @@ def iqr_algorithm(operator: InfiniteOperator,
         Shift parameter for shifted QR algorithm (Wilkinson shift recommended)
     compute_eigenvectors : bool, default=False
         Whether to compute eigenvectors
+    qr_method : str, optional
+        QR factorization used per iteration: 'householder', 'givens', or
+        'scqr' (shifted Cholesky-QR, falling back to Householder QR for
+        steps where the Cholesky factorization breaks down); 'auto' is an
+        alias for 'scqr'. By default Householder is used for small n and
+        Givens for large n.
         
     Returns:
     --------
     Dict[str, Any]
         Dictionary containing:
         - 'eigenvalues': array of computed eigenvalues
-        - 'eigenvectors': array of eigenvectors (if compute_eigenvectors=True)
+        - 'eigenvectors': array of unit-norm eigenvectors, one per column
+          (if compute_eigenvectors=True)
         - 'iterations': number of iterations performed
         - 'converged': whether convergence was achieved
         - 'residual': residual error estimate
     """
+    direct = shift is None and qr_method is None
+    
+    # Diagonal and symmetric/Hermitian tridiagonal truncations are solved
+    # without iterating
+    if direct and isinstance(operator, DiagonalOperator):
+        return _direct_result(operator._diag.head(n).copy(),
+                              np.eye(n, dtype=operator.dtype) if compute_eigenvectors else None)
+    if direct and isinstance(operator, TridiagonalOperator):
+        result = _tridiagonal_eig(operator, n, compute_eigenvectors)
+        if result is not None:
+            return result
+    
     # Get finite truncation
     A = operator.get_truncation(n)
+    if direct:
+        diagonal = A.diagonal().copy()
+        A.flat[::n + 1] = 0
+        if not A.any():
+            return _direct_result(diagonal, np.eye(n, dtype=A.dtype) if compute_eigenvectors else None)
+        A.flat[::n + 1] = diagonal
+    if shift is not None and not np.iscomplexobj(A) and complex(shift).imag != 0:
+        A = A.astype(complex)
     
-    # Initialize eigenvector matrix if needed
+    # Reduce to upper Hessenberg form once; QR steps preserve it. The
+    # eigenvector matrix starts from the reduction's orthogonal factor.
     if compute_eigenvectors:
-        Q_total = np.eye(n, dtype=operator.dtype)
+        A, Q_total = hessenberg(A, calc_q=True)
+        # For n <= 2 hessenberg returns a real identity even for complex A
+        Q_total = Q_total.astype(A.dtype, copy=False)
     else:
+        A = hessenberg(A)
         Q_total = None
+    if qr_method is None:
+        min_n = _GIVENS_MIN_N_COMPLEX if np.iscomplexobj(A) else _GIVENS_MIN_N_REAL
+        qr_method = 'givens' if n >= min_n else 'householder'
+    try:
+        qr_step = _QR_STEPS[qr_method]
+    except KeyError:
+        raise ValueError(f"Unknown qr_method: {qr_method!r}") from None
+    if isinstance(qr_step, type):
+        qr_step = qr_step()
+    
+    # Pick the shift rule once (Wilkinson shift for better convergence)
+    if shift is not None:
+        compute_shift = lambda A: shift
+    elif n < 2:
+        compute_shift = lambda A: A[0, 0]
+    elif np.iscomplexobj(A):
+        compute_shift = _wilkinson_complex
+    else:
+        compute_shift = _wilkinson_real
     
     # QR iteration
     iterations = 0
     converged = False
     
     for k in range(max_iter):
-        # Compute shift (Wilkinson shift for better convergence)
-        if shift is None:
-            # Wilkinson shift: use eigenvalue of bottom-right 2x2 block
-            if n >= 2:
-                a = A[n-2, n-2]
-                b = A[n-2, n-1]
-                c = A[n-1, n-2]
-                d = A[n-1, n-1]
-                # Eigenvalue of 2x2 matrix closest to d
-                trace = a + d
-                det = a * d - b * c
-                discriminant = trace**2 - 4 * det
-                if discriminant >= 0:
-                    lambda1 = (trace + np.sqrt(discriminant)) / 2
-                    lambda2 = (trace - np.sqrt(discriminant)) / 2
-                    shift_val = lambda2 if abs(lambda2 - d) < abs(lambda1 - d) else lambda1
-                else:
-                    shift_val = trace / 2
-            else:
-                shift_val = A[0, 0]
-        else:
-            shift_val = shift
+        shift_val = compute_shift(A)
+        if shift_val is None:
+            # Complex eigenvalue pair of a real A: continue in complex arithmetic
+            A = A.astype(complex)
+            if Q_total is not None:
+                Q_total = Q_total.astype(complex)
+            compute_shift = _wilkinson_complex
+            shift_val = compute_shift(A)
         
-        # Shift the matrix
-        A_shifted = A - shift_val * np.eye(n, dtype=A.dtype)
-        
-        # QR decomposition
-        Q, R = qr(A_shifted)
-        
-        # Reverse QR: A = R * Q + shift
-        A = R @ Q + shift_val * np.eye(n, dtype=A.dtype)
-        
-        # Accumulate eigenvectors if needed
-        if compute_eigenvectors:
-            Q_total = Q_total @ Q
+        # Shifted QR step: A = R * Q + shift, accumulating Q if needed
+        A, Q_total = qr_step(A, shift_val, Q_total)
         
         iterations = k + 1
         
-        # Check convergence: off-diagonal elements should be small
-        off_diag = np.abs(A - np.diag(np.diag(A)))
-        max_off_diag = np.max(off_diag)
+        # Check convergence: A stays upper Hessenberg, so only the
+        # subdiagonal has to vanish for the diagonal to hold the eigenvalues
+        max_off_diag = np.abs(np.diagonal(A, -1)).max(initial=0.0)
         
         if max_off_diag < tol:
             converged = True
@@ -190,8 +452,9 @@ def iqr_algorithm(operator: InfiniteOperator,
     eigenvalues = np.diag(A)
     
     # Sort by magnitude
-    idx = np.argsort(np.abs(eigenvalues))[::-1]
-    eigenvalues = eigenvalues[idx]
+    abs_ev = np.abs(eigenvalues)
+    idx = abs_ev.argsort()[::-1]
+    eigenvalues = eigenvalues.take(idx)
     
     result = {
         'eigenvalues': eigenvalues,
@@ -201,12 +464,259 @@ def iqr_algorithm(operator: InfiniteOperator,
     }
     
     if compute_eigenvectors:
-        eigenvectors = Q_total[:, idx]
-        result['eigenvectors'] = eigenvectors
+        # Q_total holds Schur vectors; map the eigenvectors of the
+        # triangular factor back through it
+        eigenvectors = Q_total @ _triangular_eigenvectors(A)
+        result['eigenvectors'] = np.take(eigenvectors, idx, axis=1)
     
     return result
 
 
+def _triangular_eigenvectors(T: np.ndarray) -> np.ndarray:
+    """
+    Unit-norm eigenvectors of the upper triangle of T by back substitution.
+    
+    Column k solves (T[:k, :k] - T[k, k] I) x = -T[:k, k] with x_k = 1.
+    Near-zero pivots from repeated eigenvalues are replaced by a tiny
+    multiple of ||T||, as LAPACK's trevc does, so the solve stays finite.
+    """
+    n = T.shape[0]
+    T = np.triu(T)
+    d = T.diagonal()
+    V = np.eye(n, dtype=T.dtype)
+    finfo = np.finfo(T.dtype)
+    small = max(finfo.eps * np.abs(T).max(initial=0.0), finfo.tiny)
+    for k in range(1, n):
+        M = T[:k, :k].copy()
+        pivots = d[:k] - d[k]
+        pivots[np.abs(pivots) < small] = small
+        M.flat[::k + 1] = pivots
+        V[:k, k] = solve_triangular(M, -T[:k, k])
+    return V / np.linalg.norm(V, axis=0)
+
+
+def _wilkinson_real(A: np.ndarray) -> Optional[float]:
+    """
+    Wilkinson shift of a real A: the eigenvalue of its trailing 2x2 block
+    closest to the last diagonal entry.
+    
+    Returns None if the block has a complex eigenvalue pair, which a real
+    shift cannot target.
+    """
+    # Python scalars keep the closed-form 2x2 solve off NumPy dispatch
+    (a, b), (c, d) = A[-2:, -2:].tolist()
+    trace = a + d
+    discriminant = trace * trace - 4 * (a * d - b * c)
+    if discriminant < 0:
+        return None
+    root = math.sqrt(discriminant)
+    # Of (trace ± root) / 2, the root with the sign of (d - a) is closest to d
+    return (trace + root) / 2 if d >= a else (trace - root) / 2
+
+
+def _wilkinson_complex(A: np.ndarray) -> complex:
+    """Wilkinson shift of a complex A (see _wilkinson_real)."""
+    (a, b), (c, d) = A[-2:, -2:].tolist()
+    trace = a + d
+    root = cmath.sqrt(trace * trace - 4 * (a * d - b * c))
+    lambda1 = (trace + root) / 2
+    lambda2 = (trace - root) / 2
+    return lambda2 if abs(lambda2 - d) < abs(lambda1 - d) else lambda1
+
+
+def _tridiagonal_eig(operator: 'TridiagonalOperator', n: int,
+                     compute_eigenvectors: bool) -> Optional[Dict[str, Any]]:
+    """
+    Solve a symmetric or Hermitian tridiagonal truncation directly.
+    
+    Uses eigh_tridiagonal for real symmetric bands and eig_banded for
+    Hermitian ones. Returns None for non-Hermitian bands, which are left to
+    the QR iteration.
+    """
+    main, upper, lower = operator.bands(n)
+    if not np.array_equal(lower, upper.conj()) or np.any(main.imag):
+        return None
+    
+    if np.iscomplexobj(upper):
+        # Upper banded storage: superdiagonal in row 0, diagonal in row 1
+        ab = np.zeros((2, n), dtype=upper.dtype)
+        ab[0, 1:] = upper
+        ab[1] = main
+        out = eig_banded(ab, eigvals_only=not compute_eigenvectors)
+    else:
+        out = eigh_tridiagonal(main.real, upper, eigvals_only=not compute_eigenvectors)
+    eigenvalues, eigenvectors = out if compute_eigenvectors else (out, None)
+    return _direct_result(eigenvalues, eigenvectors)
+
+
+def _direct_result(eigenvalues: np.ndarray, eigenvectors: Optional[np.ndarray]) -> Dict[str, Any]:
+    """Build an iqr_algorithm result for a spectrum computed without iterating."""
+    idx = np.abs(eigenvalues).argsort()[::-1]
+    result = {
+        'eigenvalues': eigenvalues.take(idx),
+        'iterations': 0,
+        'converged': True,
+        'residual': 0.0,
+    }
+    if eigenvectors is not None:
+        result['eigenvectors'] = np.take(eigenvectors, idx, axis=1)
+    return result
+
+
+def _householder_qr_step(A: np.ndarray, shift_val: complex,
+                         Q_total: Optional[np.ndarray]) -> Tuple[np.ndarray, Optional[np.ndarray]]:
+    """
+    One shifted QR step ``A - shift = QR -> RQ + shift`` using LAPACK directly.
+    
+    Q is kept as Householder reflectors (geqrf) and applied from the right
+    to R and to Q_total (ormqr/unmqr), so it is never formed explicitly.
+    A and Q_total are overwritten.
+    """
+    n = A.shape[0]
+    geqrf, ormqr = get_lapack_funcs(('geqrf', 'ormqr'), (A,))
+    lwork = max(1, 32 * n)
+    
+    A.flat[::n + 1] -= shift_val
+    qr_r, tau, _, info = geqrf(A, overwrite_a=1)
+    _check_lapack(info, 'geqrf')
+    
+    RQ, _, info = ormqr('R', 'N', qr_r, tau, np.triu(qr_r), lwork, overwrite_c=1)
+    _check_lapack(info, 'ormqr')
+    RQ.flat[::n + 1] += shift_val
+    
+    if Q_total is not None:
+        Q_total, _, info = ormqr('R', 'N', qr_r, tau, Q_total, lwork, overwrite_c=1)
+        _check_lapack(info, 'ormqr')
+    return RQ, Q_total
+
+
+def _givens_qr_step(H: np.ndarray, shift_val: complex,
+                    Q_total: Optional[np.ndarray]) -> Tuple[np.ndarray, Optional[np.ndarray]]:
+    """
+    One shifted QR step on an upper Hessenberg matrix using Givens rotations.
+    
+    The n-1 rotations that annihilate the subdiagonal each touch two rows
+    (and then two columns), so a step costs O(n²) instead of the O(n³) of a
+    dense QR factorization. H and Q_total are overwritten.
+    """
+    n = H.shape[0]
+    H.flat[::n + 1] -= shift_val
+    
+    # H - shift = QR with Q^H = G_{n-1} ... G_1
+    rotations = []
+    for k in range(n - 1):
+        a = H[k, k]
+        b = H[k + 1, k]
+        r = math.hypot(abs(a), abs(b))
+        if r == 0.0:
+            c, s = 1.0, 0.0
+        else:
+            phase = a / abs(a) if a != 0 else 1.0
+            c = abs(a) / r
+            s = phase * np.conj(b) / r
+        G = np.array([[c, s], [-np.conj(s), c]], dtype=H.dtype)
+        H[k:k + 2, k:] = G @ H[k:k + 2, k:]
+        rotations.append(G.conj().T)
+    
+    # RQ = R G_1^H ... G_{n-1}^H; R is upper triangular, so only rows up
+    # to k+1 of columns k, k+1 are non-zero
+    for k, G_h in enumerate(rotations):
+        H[:k + 2, k:k + 2] = H[:k + 2, k:k + 2] @ G_h
+        if Q_total is not None:
+            Q_total[:, k:k + 2] = Q_total[:, k:k + 2] @ G_h
+    
+    H.flat[::n + 1] += shift_val
+    return H, Q_total
+
+
+def _scqr(A: np.ndarray, eps: Optional[float] = None) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Shifted Cholesky-QR factorization ``A = QR``.
+    
+    A first pass factors ``A^H A + eps I`` and two unshifted CholeskyQR
+    passes re-orthogonalize Q (shifted CholeskyQR3). The default shift eps
+    scales with ||A||² as in Fukaya et al., which keeps the Cholesky
+    factorization from breaking down on nearly rank-deficient A. Where it
+    still breaks down (e.g. A is singular to working precision, as for a
+    shifted 1x1 block), Householder QR is used instead.
+    """
+    n = A.shape[0]
+    if eps is None:
+        eps = 11 * (2 * n * n + n) * np.finfo(A.dtype).eps * np.linalg.norm(A) ** 2
+    try:
+        Q, R = _cholesky_qr(A, eps)
+        # The shift bounds cond(Q) by about u^(-1/2); two unshifted passes
+        # (CholeskyQR2) then restore orthogonality to working precision
+        for _ in range(2):
+            Q, R_k = _cholesky_qr(Q, 0.0)
+            R = R_k @ R
+    except np.linalg.LinAlgError:
+        return qr(A)
+    return Q, R
+
+
+def _cholesky_qr(A: np.ndarray, eps: float) -> Tuple[np.ndarray, np.ndarray]:
+    """One Cholesky-QR pass on the Gram matrix of A shifted by eps."""
+    n = A.shape[0]
+    P = A.conj().T @ A
+    P.flat[::n + 1] += eps
+    L = cholesky(P, lower=True)
+    Q = solve_triangular(L, A.conj().T, lower=True).conj().T
+    return Q, L.conj().T
+
+
+class _ScqrStep:
+    """
+    Shifted QR steps using shifted Cholesky-QR.
+    
+    Q is formed explicitly, so Q_total is updated with a GEMM. The product
+    is written into a spare buffer (the previous Q_total) and the two are
+    swapped, so no n×n array is allocated for it per iteration.
+    """
+    
+    __slots__ = ('_spare',)
+    
+    def __init__(self):
+        self._spare = None
+    
+    def __call__(self, A: np.ndarray, shift_val: complex,
+                 Q_total: Optional[np.ndarray]) -> Tuple[np.ndarray, Optional[np.ndarray]]:
+        n = A.shape[0]
+        shifted = A.copy()
+        shifted.flat[::n + 1] -= shift_val
+        Q, R = _scqr(shifted)
+        RQ = R @ Q
+        RQ.flat[::n + 1] += shift_val
+        if Q_total is not None:
+            Q_total = self._accumulate(Q_total, Q)
+        return RQ, Q_total
+    
+    def _accumulate(self, Q_total: np.ndarray, Q: np.ndarray) -> np.ndarray:
+        spare = self._spare
+        if (spare is None or spare.dtype != Q_total.dtype
+                or not spare.flags.f_contiguous):
+            # gemm only writes into a Fortran-ordered c in place
+            spare = np.empty(Q_total.shape, dtype=Q_total.dtype, order='F')
+        gemm = get_blas_funcs('gemm', (Q_total, Q))
+        product = gemm(1.0, Q_total, Q, beta=0.0, c=spare, overwrite_c=1)
+        self._spare = Q_total
+        return product
+
+
+# Step functions, or classes to instantiate once per run for stateful steps
+_QR_STEPS = {
+    'householder': _householder_qr_step,
+    'givens': _givens_qr_step,
+    'scqr': _ScqrStep,
+    'auto': _ScqrStep,
+}
+
+
+def _check_lapack(info: int, name: str) -> None:
+    if info != 0:
+        raise np.linalg.LinAlgError(f"LAPACK {name} failed with info={info}")
+
+
 def iqr_spectrum(operator: InfiniteOperator,
                  n_range: Union[int, List[int]] = None,
                  max_iter: int = 1000,
@@ -252,10 +762,22 @@ def iqr_spectrum(operator: InfiniteOperator,
     results_by_n = {}
     all_eigenvalues = []
     
-    for n in n_range:
-        result = iqr_algorithm(operator, n=n, max_iter=max_iter, tol=tol)
-        results_by_n[n] = result
-        all_eigenvalues.extend(result['eigenvalues'].tolist())
+    # Fill the operator's entry (or band) cache once for the largest
+    # truncation, so the smaller ones are read from it rather than recomputed
+    if isinstance(operator, TridiagonalOperator):
+        operator.bands(max(n_range))
+    else:
+        operator.get_truncation(max(n_range))
+    
+    # Truncation sizes are independent; LAPACK releases the GIL, so run
+    # them concurrently
+    with ThreadPoolExecutor(max_workers=len(n_range)) as executor:
+        futures = [executor.submit(iqr_algorithm, operator, n=n, max_iter=max_iter, tol=tol)
+                   for n in n_range]
+        for n, future in zip(n_range, futures):
+            result = future.result()
+            results_by_n[n] = result
+            all_eigenvalues.extend(result['eigenvalues'].tolist())
     
     # Estimate spectrum (could use more sophisticated methods)
     if len(n_range) > 1:
@@ -273,6 +795,142 @@ def iqr_spectrum(operator: InfiniteOperator,
     }
 
 
+def iqr_algorithm_batch(operators: List[InfiniteOperator],
+                        n: int = 50,
+                        max_iter: int = 1000,
+                        tol: float = 1e-10,
+                        backend: Optional[str] = None) -> List[Dict[str, Any]]:
+    """
+    Run the IQR algorithm on a family of operators at once.
+    
+    The n×n truncations are reduced to Hessenberg form and stacked into a
+    (B, n, n) array, and every QR iteration is a single batched QR with one
+    Wilkinson shift per matrix. On a GPU (CuPy) or under JAX this replaces
+    B separate Python-driven iterations.
+    
+    Parameters:
+    -----------
+    operators : List[InfiniteOperator]
+        Operators to compute spectra for
+    n : int, default=50
+        Size of the finite truncations
+    max_iter : int, default=1000
+        Maximum number of QR iterations
+    tol : float, default=1e-10
+        Convergence tolerance
+    backend : str, optional
+        'cupy', 'jax' or 'numpy' for the batched iteration, or 'threads' to
+        run iqr_algorithm on each operator concurrently. By default CuPy is
+        used if installed, then JAX (with 64-bit mode enabled), and
+        otherwise threads.
+        
+    Returns:
+    --------
+    List[Dict[str, Any]]
+        One result per operator, with the same keys as iqr_algorithm
+        (without eigenvectors)
+    """
+    if backend is None:
+        backend = _default_batch_backend()
+    if backend == 'threads' or n < 2 or not operators:
+        with ThreadPoolExecutor(max_workers=max(len(operators), 1)) as executor:
+            futures = [executor.submit(iqr_algorithm, op, n=n, max_iter=max_iter, tol=tol)
+                       for op in operators]
+            return [future.result() for future in futures]
+    
+    xp, to_numpy, compile_step = _batch_backend(backend)
+    step = compile_step(lambda A: _batched_shifted_qr_step(xp, A))
+    
+    truncations = [op.get_truncation(n) for op in operators]
+    real_input = [not np.iscomplexobj(T) for T in truncations]
+    H = np.stack([hessenberg(T.astype(complex, copy=False)) for T in truncations])
+    A = xp.asarray(H)
+    B = len(operators)
+    diagonals = np.empty((B, n), dtype=complex)
+    residuals = np.zeros(B)
+    iterations = np.zeros(B, dtype=int)
+    converged = np.zeros(B, dtype=bool)
+    
+    for k in range(max_iter):
+        A = step(A)
+        sub = to_numpy(xp.abs(xp.diagonal(A, -1, axis1=1, axis2=2)).max(axis=1))
+        # Record each matrix the first time it converges
+        newly = (sub < tol) & ~converged
+        if newly.any():
+            diagonals[newly] = to_numpy(xp.diagonal(A, axis1=1, axis2=2))[newly]
+            residuals[newly] = sub[newly]
+            iterations[newly] = k + 1
+            converged |= newly
+            if converged.all():
+                break
+    
+    if not converged.all():
+        pending = ~converged
+        diagonals[pending] = to_numpy(xp.diagonal(A, axis1=1, axis2=2))[pending]
+        iterations[pending] = max_iter
+    
+    results = []
+    for b in range(B):
+        eigenvalues = diagonals[b]
+        # The batch runs in complex arithmetic; hand real operators back
+        # real eigenvalues, as iqr_algorithm does, unless they have a
+        # complex pair
+        if real_input[b] and not np.any(np.abs(eigenvalues.imag) > tol):
+            eigenvalues = eigenvalues.real
+        idx = np.abs(eigenvalues).argsort()[::-1]
+        results.append({
+            'eigenvalues': eigenvalues.take(idx),
+            'iterations': int(iterations[b]),
+            'converged': bool(converged[b]),
+            'residual': residuals[b] if converged[b] else None,
+        })
+    return results
+
+
+def _batched_shifted_qr_step(xp, A):
+    """One Wilkinson-shifted QR step on each matrix of a (B, n, n) stack."""
+    n = A.shape[-1]
+    a, b = A[:, n-2, n-2], A[:, n-2, n-1]
+    c, d = A[:, n-1, n-2], A[:, n-1, n-1]
+    trace = a + d
+    root = xp.sqrt(trace * trace - 4 * (a * d - b * c))
+    lambda1 = (trace + root) / 2
+    lambda2 = (trace - root) / 2
+    shift = xp.where(xp.abs(lambda2 - d) < xp.abs(lambda1 - d), lambda2, lambda1)
+    S = shift[:, None, None] * xp.eye(n, dtype=A.dtype)
+    Q, R = xp.linalg.qr(A - S)
+    return R @ Q + S
+
+
+def _default_batch_backend() -> str:
+    """Pick the fastest available batched backend."""
+    try:
+        import cupy  # noqa: F401
+        return 'cupy'
+    except ImportError:
+        pass
+    try:
+        import jax
+    except ImportError:
+        return 'threads'
+    # In JAX's default 32-bit mode the iteration cannot reach typical tolerances
+    return 'jax' if jax.config.jax_enable_x64 else 'threads'
+
+
+def _batch_backend(name: str) -> Tuple[Any, Callable, Callable]:
+    """Return (array module, to-NumPy conversion, step compiler) for a backend."""
+    if name == 'cupy':
+        import cupy
+        return cupy, cupy.asnumpy, lambda f: f
+    if name == 'jax':
+        import jax
+        import jax.numpy as jnp
+        return jnp, np.asarray, jax.jit
+    if name == 'numpy':
+        return np, np.asarray, lambda f: f
+    raise ValueError(f"Unknown backend: {name!r}")
+
+
 def create_diagonal_operator(diagonal_values: Union[Callable, np.ndarray, List]) -> InfiniteOperator:
     """
     Create an infinite diagonal operator.
@@ -286,22 +944,11 @@ def create_diagonal_operator(diagonal_values: Union[Callable, np.ndarray, List])
     Returns:
     --------
     InfiniteOperator
-        Diagonal operator
+        Diagonal operator, float64 when the values are real (a callable is
+        sampled at index 0) and complex otherwise
     """
-    if callable(diagonal_values):
-        def matrix_func(i, j):
-            if i == j:
-                return diagonal_values(i)
-            return 0.0
-    else:
-        # Convert to list/array
-        diag = np.asarray(diagonal_values)
-        def matrix_func(i, j):
-            if i == j and i < len(diag):
-                return diag[i]
-            return 0.0
-    
-    return InfiniteOperator(matrix_func)
+    dtype = np.float64 if _is_real(diagonal_values) else complex
+    return DiagonalOperator(diagonal_values, dtype=dtype)
 
 
 def create_tridiagonal_operator(main_diag: Union[Callable, np.ndarray, List],
@@ -322,44 +969,21 @@ def create_tridiagonal_operator(main_diag: Union[Callable, np.ndarray, List],
     Returns:
     --------
     InfiniteOperator
-        Tridiagonal operator
+        Tridiagonal operator, float64 when all bands are real (callables are
+        sampled at index 0) and complex otherwise
     """
-    # Convert to functions
-    if callable(main_diag):
-        main_func = main_diag
-    else:
-        main_arr = np.asarray(main_diag)
-        def main_func(i):
-            return main_arr[i] if i < len(main_arr) else 0.0
-    
-    if upper_diag is None:
-        upper_func = lambda i: 0.0
-    elif callable(upper_diag):
-        upper_func = upper_diag
-    else:
-        upper_arr = np.asarray(upper_diag)
-        def upper_func(i):
-            return upper_arr[i] if i < len(upper_arr) else 0.0
-    
-    if lower_diag is None:
-        lower_func = lambda i: 0.0
-    elif callable(lower_diag):
-        lower_func = lower_diag
-    else:
-        lower_arr = np.asarray(lower_diag)
-        def lower_func(i):
-            return lower_arr[i] if i < len(lower_arr) else 0.0
-    
-    def matrix_func(i, j):
-        if i == j:
-            return main_func(i)
-        elif j == i + 1:
-            return upper_func(i)
-        elif j == i - 1:
-            return lower_func(j)
-        return 0.0
-    
-    return InfiniteOperator(matrix_func)
+    bands = (main_diag, upper_diag, lower_diag)
+    dtype = np.float64 if all(_is_real(band) for band in bands) else complex
+    return TridiagonalOperator(main_diag, upper_diag, lower_diag, dtype=dtype)
+
+
+def _is_real(values: Union[Callable, np.ndarray, List, None]) -> bool:
+    """Whether a band holds real values; callables are judged by their value at 0."""
+    if values is None:
+        return True
+    if callable(values):
+        return isinstance(values(0), (int, float, np.integer, np.floating))
+    return np.isrealobj(np.asarray(values))
 
 
 # Example usage functions
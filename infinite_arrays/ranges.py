@@ -3,6 +3,7 @@ Infinite range types for indexing infinite arrays.
 """
 
 import itertools
+import numpy as np
 from typing import Iterator, Optional, Union, overload
 from .infinity import Infinity
 from ._utils import get_infinity
@@ -12,9 +13,26 @@ _INF = get_infinity()
 globals()['∞'] = _INF
 
 
+def _arange_chunks(start: int, step: int, size: int) -> Iterator[np.ndarray]:
+    """
+    Yield an infinite range in consecutive int64 blocks of the given size.
+    
+    Preferred over ``iter`` for numeric code, which can then work on whole
+    blocks with NumPy ufuncs instead of one Python int at a time. Raises
+    ValueError for a size below 1 when called, not on the first ``next``.
+    """
+    if size < 1:
+        raise ValueError(f"chunk size must be at least 1, got {size}")
+    span = size * step
+    return (np.arange(first, first + span, step, dtype=np.int64)
+            for first in itertools.count(start, span))
+
+
 class OneToInf:
     """Infinite range starting from 1: 1, 2, 3, ..."""
     
+    __slots__ = ('start', '__weakref__')
+    
     def __init__(self):
         self.start = 1
     
@@ -27,6 +45,10 @@ class OneToInf:
     def __iter__(self) -> Iterator[int]:
         return itertools.count(1)
     
+    def chunks(self, size: int = 4096) -> Iterator[np.ndarray]:
+        """Yield 1, 2, 3, ... in int64 blocks of ``size`` values."""
+        return _arange_chunks(1, 1, size)
+    
     def __getitem__(self, key: Union[int, slice]) -> Union[int, 'OneToInf']:
         if isinstance(key, int):
             if key < 0:
@@ -41,11 +63,11 @@ class OneToInf:
         raise TypeError("len() of infinite OneToInf is undefined")
     
     def __contains__(self, item: int) -> bool:
-        return isinstance(item, int) and item >= 1
+        return type(item) is int and item >= 1
     
     def index(self, value: int) -> int:
         """Return 0-based index of value."""
-        if not isinstance(value, int) or value < 1:
+        if type(value) is not int or value < 1:
             raise ValueError(f"{value} not in OneToInf")
         return value - 1
     
@@ -57,12 +79,15 @@ class OneToInf:
 class InfUnitRange:
     """Infinite unit range starting from a given value: start, start+1, start+2, ..."""
     
+    __slots__ = ('start', 'step', '_unit', '__weakref__')
+    
     def __init__(self, start: int = 1, step: int = 1):
         self.start = start
         self.step = step
+        self._unit = step == 1
     
     def __repr__(self) -> str:
-        if self.step == 1:
+        if self._unit:
             return f"InfUnitRange({self.start})"
         return f"InfUnitRange({self.start}, step={self.step})"
     
@@ -72,6 +97,10 @@ class InfUnitRange:
     def __iter__(self) -> Iterator[int]:
         return itertools.count(self.start, self.step)
     
+    def chunks(self, size: int = 4096) -> Iterator[np.ndarray]:
+        """Yield start, start+step, ... in int64 blocks of ``size`` values."""
+        return _arange_chunks(self.start, self.step, size)
+    
     def __getitem__(self, key: Union[int, slice]) -> Union[int, 'InfUnitRange']:
         if isinstance(key, int):
             if key < 0:
@@ -85,18 +114,21 @@ class InfUnitRange:
         raise TypeError("len() of infinite InfUnitRange is undefined")
     
     def __contains__(self, item: int) -> bool:
-        if not isinstance(item, int):
-            return False
-        if self.step == 1:
-            return item >= self.start
-        # For non-unit steps, check if item is reachable
-        return (item - self.start) % self.step == 0 and item >= self.start
+        # For non-unit steps, item must also be reachable from start
+        return type(item) is int and item >= self.start and (
+            self._unit or (item - self.start) % self.step == 0)
     
     def index(self, value: int) -> int:
         """Return 0-based index of value."""
-        if value not in self:
-            raise ValueError(f"{value} not in {self}")
-        return (value - self.start) // self.step
+        if type(value) is int:
+            offset = value - self.start
+            if offset >= 0:
+                if self._unit:
+                    return offset
+                q, r = divmod(offset, self.step)
+                if r == 0:
+                    return q
+        raise ValueError(f"{value} not in {self}")
     
     def count(self, value: int) -> int:
         """Return count of value (always 1 if in range, 0 otherwise)."""
@@ -106,9 +138,13 @@ class InfUnitRange:
 class InfStepRange:
     """Infinite step range: start, start+step, start+2*step, ..."""
     
+    __slots__ = ('start', 'step', '_sign', '__weakref__')
+    
     def __init__(self, start: int, step: int):
         self.start = start
         self.step = step
+        # Direction of travel, so membership is one signed comparison
+        self._sign = 1 if step > 0 else -1
     
     def __repr__(self) -> str:
         return f"InfStepRange({self.start}, {self.step})"
@@ -119,6 +155,10 @@ class InfStepRange:
     def __iter__(self) -> Iterator[int]:
         return itertools.count(self.start, self.step)
     
+    def chunks(self, size: int = 4096) -> Iterator[np.ndarray]:
+        """Yield the range in int64 blocks of ``size`` values (descending if step < 0)."""
+        return _arange_chunks(self.start, self.step, size)
+    
     def __getitem__(self, key: Union[int, slice]) -> Union[int, 'InfStepRange']:
         if isinstance(key, int):
             if key < 0:
@@ -132,18 +172,16 @@ class InfStepRange:
         raise TypeError("len() of infinite InfStepRange is undefined")
     
     def __contains__(self, item: int) -> bool:
-        if not isinstance(item, int):
-            return False
-        return (item - self.start) % self.step == 0 and (
-            (self.step > 0 and item >= self.start) or
-            (self.step < 0 and item <= self.start)
-        )
+        return type(item) is int and (item - self.start) * self._sign >= 0 and (
+            (item - self.start) % self.step == 0)
     
     def index(self, value: int) -> int:
         """Return 0-based index of value."""
-        if value not in self:
-            raise ValueError(f"{value} not in {self}")
-        return (value - self.start) // self.step
+        if type(value) is int:
+            q, r = divmod(value - self.start, self.step)
+            if r == 0 and q >= 0:
+                return q
+        raise ValueError(f"{value} not in {self}")
     
     def count(self, value: int) -> int:
         """Return count of value (always 1 if in range, 0 otherwise)."""
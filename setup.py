@@ -39,6 +39,9 @@ setup(
             "flake8>=4.0.0",
             "mypy>=0.950",
         ],
+        "jit": [
+            "numba>=0.56.0",
+        ],
     },
 )
 
@@ -2,18 +2,27 @@
 Basic tests for InfiniteArrays.
 """
 
+import itertools
+import weakref
 import pytest
 import numpy as np
+import infinite_arrays
 from infinite_arrays import (
-    ∞, Ones, Zeros, Fill, InfiniteDiagonal,
+    Ones, Zeros, Fill, InfiniteDiagonal,
     cache, CachedArray, BroadcastArray,
-    OneToInf, InfUnitRange, InfStepRange
+    OneToInf, InfUnitRange, InfStepRange, Infinity,
+    InfiniteOperator, TridiagonalOperator, iqr_algorithm, iqr_algorithm_batch,
+    create_diagonal_operator, create_tridiagonal_operator,
 )
 
+# Python doesn't allow ∞ as an identifier in source code, so fetch it from
+# the package namespace
+INF = infinite_arrays.__dict__['∞']
+
 
 def test_ones():
     """Test Ones infinite array."""
-    x = Ones(∞)
+    x = Ones(INF)
     assert x[0] == 1.0
     assert x[5] == 1.0
     assert x[100] == 1.0
@@ -21,14 +30,14 @@ def test_ones():
 
 def test_zeros():
     """Test Zeros infinite array."""
-    x = Zeros(∞)
+    x = Zeros(INF)
     assert x[0] == 0.0
     assert x[5] == 0.0
 
 
 def test_fill():
     """Test Fill infinite array."""
-    x = Fill(42, ∞)
+    x = Fill(42, INF)
     assert x[0] == 42
     assert x[5] == 42
 
@@ -42,9 +51,27 @@ def test_diagonal():
     assert D[0, 1] == 0.0  # Off-diagonal
 
 
+def test_diagonal_to_dense():
+    """Test dense truncation of InfiniteDiagonal."""
+    np.testing.assert_array_equal(InfiniteDiagonal(range(1, 10000)).to_dense(3), np.diag([1.0, 2.0, 3.0]))
+    np.testing.assert_array_equal(InfiniteDiagonal([5, 6]).to_dense(3), np.diag([5.0, 6.0, 0.0]))
+    np.testing.assert_array_equal(InfiniteDiagonal(iter([1, 2, 3, 4])).to_dense(2), np.diag([1.0, 2.0]))
+    np.testing.assert_array_equal(InfiniteDiagonal(x for x in [1 + 1j, 2]).to_dense(2), np.diag([1 + 1j, 2]))
+    assert repr(InfiniteDiagonal([1j, 2j])).splitlines()[1].startswith("1j  ⋅")
+    assert repr(InfiniteDiagonal(range(1, 20))).splitlines()[1].startswith("1  ⋅")
+
+
+def test_diagonal_from_iterator():
+    """Test InfiniteDiagonal backed by a one-shot iterator."""
+    D = InfiniteDiagonal(i * i for i in range(1, 5))
+    assert D[2, 2] == 9
+    assert D[0, 0] == 1
+    assert D[10, 10] == 0  # Past the end of the iterator
+
+
 def test_cache():
     """Test caching functionality."""
-    x = Ones(∞)
+    x = Ones(INF)
     C = cache(x)
     assert isinstance(C, CachedArray)
     assert C[0] == 1.0
@@ -53,17 +80,115 @@ def test_cache():
     assert C[1] == 1.0  # Other elements unchanged
 
 
+def test_cache_growth():
+    """Test cached writes beyond the initial buffer and of other dtypes."""
+    C = cache(Ones(INF))
+    C[1000] = 5.0
+    assert C[1000] == 5.0
+    assert C[999] == 1.0
+    C[2] = 1 + 2j  # Not representable as float64
+    assert C[2] == 1 + 2j
+    C[2] = 4.0
+    assert C[2] == 4.0
+    C[3] = 2**60 + 1  # Stored as given, not cast to float64
+    assert C[3] == 2**60 + 1
+
+
+def test_cache_large_key():
+    """Test that large sparse keys are cached without a dense allocation."""
+    C = cache(Ones(INF))
+    assert C[10**12] == 1.0
+    C[10**12 + 1] = 5
+    assert C[10**12 + 1] == 5
+    assert C[3] == 1.0
+
+
+def test_array_weakref():
+    """Test that slotted arrays, ranges and operators support weak references."""
+    arrays = [Ones(INF), Zeros(INF), Fill(2.0, INF), InfiniteDiagonal([1.0, 2.0]),
+              BroadcastArray(lambda i: i, (INF,)), cache(Ones(INF)),
+              OneToInf(), InfUnitRange(2), InfStepRange(1, 3),
+              create_diagonal_operator(lambda i: 1.0),
+              create_tridiagonal_operator(lambda i: 2.0, lambda i: -1.0, lambda i: -1.0)]
+    for arr in arrays:
+        assert weakref.ref(arr)() is arr
+
+
 def test_broadcast_array():
     """Test BroadcastArray."""
     def func(i):
         return i * 2
     
-    arr = BroadcastArray(func, (∞,))
+    arr = BroadcastArray(func, (INF,))
     assert arr[0] == 0
     assert arr[1] == 2
     assert arr[5] == 10
 
 
+def test_broadcast_materialize():
+    """Test bulk evaluation of BroadcastArray segments."""
+    arr = BroadcastArray(lambda i: i * 2, (INF,))
+    np.testing.assert_array_equal(arr.materialize(4), [0, 2, 4, 6])
+    np.testing.assert_array_equal(arr[2:5], [4, 6, 8])
+    assert arr[2:] is arr
+    
+    # Plain functions are only ever called per index, so Python ints stay exact
+    powers = BroadcastArray(lambda i: 2**i, (INF,))
+    assert powers[60:71][-1] == powers[70] == 2**70
+    
+    # Array-aware functions can opt in to whole-block evaluation
+    vec = BroadcastArray(lambda i: i * 2, (INF,), vectorized=True)
+    np.testing.assert_array_equal(vec.materialize(4), [0, 2, 4, 6])
+    np.testing.assert_array_equal(vec[2:5], [4, 6, 8])
+
+
+def test_broadcast_iteration_dtype():
+    """Test that iteration keeps the element function's result types."""
+    complex_arr = BroadcastArray(lambda i: 1j * (i + 1), (INF,))
+    assert list(itertools.islice(complex_arr, 3)) == [1j, 2j, 3j]
+    int_arr = BroadcastArray(lambda i: i * 2, (INF,))
+    assert all(type(x) is int for x in itertools.islice(int_arr, 3))
+    
+    # Functions defined only on a finite prefix stop at their first failure
+    data = list(range(10))
+    prefix = BroadcastArray(lambda i: data[i], (INF,))
+    assert list(itertools.islice(prefix, 5)) == [0, 1, 2, 3, 4]
+    assert list(prefix) == data
+    
+    # Any other error is a bug in func and must propagate
+    broken = BroadcastArray(lambda i: 1 / (i - 20), (INF,))
+    with pytest.raises(ZeroDivisionError):
+        list(itertools.islice(broken, 30))
+
+
+def test_broadcast_materialize_2d():
+    """Test 2D block evaluation, with and without array-aware functions."""
+    expected = [[1.0, 0.5, 1 / 3], [0.5, 1.0, 0.5]]
+    vectorized = BroadcastArray(lambda k: 1.0 / (1.0 + abs(k[0] - k[1])), (INF, INF),
+                                vectorized=True)
+    np.testing.assert_allclose(vectorized.materialize_2d(2, 3), expected)
+    scalar_only = BroadcastArray(lambda k: 1.0 / (1.0 + abs(int(k[0]) - int(k[1]))), (INF, INF))
+    np.testing.assert_allclose(scalar_only.materialize_2d(2, 3), expected)
+
+
+def test_broadcast_arithmetic():
+    """Test lazy arithmetic results and that they are freed without the GC."""
+    arr = BroadcastArray(lambda i: i, (INF,)) * 2 + 1
+    assert arr[3] == 7
+    np.testing.assert_array_equal(arr.materialize(3), [1, 3, 5])
+    ref = weakref.ref(arr)
+    del arr
+    assert ref() is None
+
+
+def test_broadcast_array_jit():
+    """Test numba-compiled BroadcastArray."""
+    pytest.importorskip("numba")
+    arr = BroadcastArray(lambda i: i * 2.0, (INF,), jit=True)
+    assert arr[3] == 6.0
+    np.testing.assert_array_equal(arr.materialize(3), [0.0, 2.0, 4.0])
+
+
 def test_one_to_inf():
     """Test OneToInf range."""
     r = OneToInf()
@@ -92,16 +217,30 @@ def test_inf_step_range():
     assert r[1] == 2
 
 
+def test_range_chunks():
+    """Test block iteration over infinite ranges."""
+    first, second = itertools.islice(InfStepRange(10, -3).chunks(4), 2)
+    assert first.dtype == np.int64
+    assert list(first) == [10, 7, 4, 1]
+    assert list(second) == [-2, -5, -8, -11]
+    block = next(OneToInf().chunks(5))
+    assert list(block) == list(itertools.islice(OneToInf(), 5))
+    for bad in (0, -1):
+        with pytest.raises(ValueError):
+            OneToInf().chunks(bad)
+
+
 def test_infinity_comparison():
     """Test infinity constant."""
-    assert ∞ == ∞
-    assert ∞ is ∞
-    assert str(∞) == "∞"
+    assert INF == INF
+    assert INF is INF
+    assert Infinity() is INF
+    assert str(INF) == "∞"
 
 
 def test_array_operations():
     """Test array operations."""
-    x = Ones(∞)
+    x = Ones(INF)
     y = x + 2
     assert y[0] == 3.0
     
@@ -109,6 +248,161 @@ def test_array_operations():
     assert z[0] == 3.0
 
 
+def test_chained_scalar_operations():
+    """Test chains of scalar operations on Ones."""
+    x = Ones(INF)
+    y = (x + 2) * 3 - 1
+    assert y[0] == 8.0
+    assert y[10] == 8.0
+    assert (10 - x * 2)[0] == 8.0
+    assert (x + x)[0] == 2.0
+
+
+def test_constant_folding():
+    """Test scalar arithmetic on constant arrays returns Fill."""
+    assert isinstance(Ones(INF) + 2, Fill)
+    assert isinstance(Fill(2, INF) * Fill(3, INF), Fill)
+    assert (Fill(2, INF) * Fill(3, INF))[4] == 6
+    assert isinstance(Zeros(INF) * 5, Zeros)
+    with np.errstate(invalid="ignore"):
+        assert np.isnan((Zeros(INF) * np.inf)[0])
+        assert np.isnan((Zeros(INF) * np.nan)[0])
+    assert (Zeros(INF) + 5)[0] == 5.0
+    assert (1 / Fill(4.0, INF))[0] == 0.25
+    
+    # The folded dtype follows NumPy promotion, not the operand's dtype
+    assert (Ones(INF, dtype=np.int64) + 0.5).dtype == np.float64
+    assert (Ones(INF, dtype=np.int64) + 2).dtype == np.int64
+    assert (Ones(INF) * 1j).dtype == np.complex128
+    assert (Zeros(INF, dtype=np.int64) * 0.5).dtype == np.float64
+
+
+def test_operator_truncation():
+    """Test finite truncations of infinite operators."""
+    op = InfiniteOperator(lambda i, j: 1.0 / (1.0 + abs(i - j)))
+    np.testing.assert_allclose(op.get_truncation(2), [[1.0, 0.5], [0.5, 1.0]])
+    
+    diag = create_diagonal_operator([1.0, 2.0])
+    np.testing.assert_array_equal(diag.get_truncation(3), np.diag([1.0, 2.0, 0.0]))
+    
+    tri = create_tridiagonal_operator(lambda i: 2.0, lambda i: -1.0, lambda i: -3.0)
+    expected = [[2.0, -1.0, 0.0], [-3.0, 2.0, -1.0], [0.0, -3.0, 2.0]]
+    np.testing.assert_array_equal(tri.get_truncation(3), expected)
+
+
+def test_tridiagonal_operator():
+    """Test element access and band truncation of tridiagonal operators."""
+    tri = create_tridiagonal_operator(lambda i: float(i + 1), [0.5, 0.5], [4.0])
+    assert isinstance(tri, TridiagonalOperator)
+    assert tri[2, 2] == 3.0
+    assert tri[1, 2] == 0.5 and tri[2, 3] == 0.0
+    assert tri[1, 0] == 4.0 and tri[2, 1] == 0.0
+    assert tri[0, 2] == 0.0
+    expected = np.array([[tri[i, j] for j in range(4)] for i in range(4)])
+    np.testing.assert_array_equal(tri.get_truncation(4), expected)
+
+
+def test_real_operator_dtype():
+    """Test that real band inputs give float64 operators and spectra."""
+    tri = create_tridiagonal_operator(lambda i: float(i + 1), lambda i: 0.3, lambda i: 0.3)
+    assert tri.get_truncation(3).dtype == np.float64
+    assert iqr_algorithm(tri, n=6)['eigenvalues'].dtype == np.float64
+    assert create_diagonal_operator([1.0, 2j]).get_truncation(2).dtype == np.complex128
+    
+    # Complex eigenvalues of a real operator are still found
+    rot = create_tridiagonal_operator(lambda i: 0.0, lambda i: 1.0, lambda i: -1.0)
+    result = iqr_algorithm(rot, n=4)
+    assert result['converged']
+    np.testing.assert_allclose(np.sort(np.abs(result['eigenvalues'].imag)),
+                               np.sort(np.abs(np.linalg.eigvals(rot.get_truncation(4)).imag)), atol=1e-8)
+
+
+def test_iqr_symmetric_tridiagonal():
+    """Test the direct solver path for symmetric tridiagonal operators."""
+    tri = create_tridiagonal_operator(lambda i: 2.0, lambda i: -1.0, lambda i: -1.0)
+    A = tri.get_truncation(20)
+    result = iqr_algorithm(tri, n=20, compute_eigenvectors=True)
+    assert result['converged']
+    np.testing.assert_allclose(np.sort(result['eigenvalues']), np.linalg.eigvalsh(A), atol=1e-12)
+    V = result['eigenvectors']
+    np.testing.assert_allclose(A @ V, V * result['eigenvalues'], atol=1e-10)
+
+
+def test_iqr_diagonal_shortcut():
+    """Test that diagonal operators return their diagonal without iterating."""
+    diag = create_diagonal_operator(lambda i: float(i + 1))
+    result = iqr_algorithm(diag, n=5, compute_eigenvectors=True)
+    assert result['iterations'] == 0 and result['converged']
+    np.testing.assert_array_equal(result['eigenvalues'], [5.0, 4.0, 3.0, 2.0, 1.0])
+    np.testing.assert_array_equal(result['eigenvectors'], np.eye(5)[:, ::-1])
+    
+    generic = InfiniteOperator(lambda i, j: float(i + 1) if i == j else 0.0)
+    result = iqr_algorithm(generic, n=5)
+    assert result['iterations'] == 0
+    np.testing.assert_array_equal(result['eigenvalues'], [5.0, 4.0, 3.0, 2.0, 1.0])
+
+
+def test_iqr_qr_methods():
+    """Test that every QR method converges to the same spectrum."""
+    op = InfiniteOperator(lambda i, j: 1.0 / (1.0 + abs(i - j)))
+    A = op.get_truncation(10)
+    expected = np.linalg.eigvalsh(A.real)
+    for method in ("householder", "givens", "scqr", "auto"):
+        result = iqr_algorithm(op, n=10, qr_method=method, compute_eigenvectors=True)
+        assert result['converged']
+        np.testing.assert_allclose(np.sort(result['eigenvalues'].real), expected, atol=1e-8)
+        V = result['eigenvectors']
+        np.testing.assert_allclose(A @ V, V * result['eigenvalues'], atol=1e-8)
+    with pytest.raises(ValueError):
+        iqr_algorithm(op, n=10, qr_method="lu")
+    
+    # Tiny complex truncations must keep Q complex (hessenberg hands back a
+    # real identity for n <= 2)
+    herm = InfiniteOperator(lambda i, j: 2.0 if i == j else (0.5j if j == i + 1 else
+                                                             (-0.5j if i == j + 1 else 0.0)))
+    A2 = herm.get_truncation(2)
+    for method in ("householder", "givens"):
+        result = iqr_algorithm(herm, n=2, qr_method=method, compute_eigenvectors=True)
+        V = result['eigenvectors']
+        np.testing.assert_allclose(A2 @ V, V * result['eigenvalues'], atol=1e-10)
+    
+    nonsym = InfiniteOperator(lambda i, j: 1.0 / (1.0 + abs(i - j)) + (0.3 if j == i + 1 else 0.0))
+    expected = np.sort_complex(np.linalg.eigvals(nonsym.get_truncation(6)))
+    for method in ("householder", "givens", "scqr", "auto"):
+        result = iqr_algorithm(nonsym, n=6, qr_method=method)
+        assert result['converged']
+        np.testing.assert_allclose(np.sort_complex(result['eigenvalues']), expected, atol=1e-8)
+    
+    # A 1x1 truncation shifts to exactly zero, where Cholesky-QR cannot work
+    result = iqr_algorithm(op, n=1, qr_method="scqr")
+    assert result['converged']
+    np.testing.assert_allclose(result['eigenvalues'], [1.0])
+
+
+def test_iqr_eigenvectors_nonsymmetric():
+    """Test that non-normal operators get eigenvectors, not Schur vectors."""
+    op = create_tridiagonal_operator(lambda i: float(i), lambda i: 2.0, lambda i: 0.5)
+    A = op.get_truncation(10)
+    result = iqr_algorithm(op, n=10, compute_eigenvectors=True)
+    assert result['converged']
+    V = result['eigenvectors']
+    np.testing.assert_allclose(np.linalg.norm(V, axis=0), 1.0)
+    np.testing.assert_allclose(A @ V, V * result['eigenvalues'], atol=1e-8)
+
+
+def test_iqr_algorithm_batch():
+    """Test that batched IQR agrees with per-operator runs."""
+    ops = [create_tridiagonal_operator(lambda i, s=s: s * (i + 1.0), lambda i: 0.3, lambda i: 0.3)
+           for s in (1.0, 2.0)]
+    expected = [iqr_algorithm(op, n=8)['eigenvalues'] for op in ops]
+    for backend in ("numpy", "threads"):
+        results = iqr_algorithm_batch(ops, n=8, backend=backend)
+        assert all(r['converged'] for r in results)
+        for result, ev in zip(results, expected):
+            assert result['eigenvalues'].dtype == ev.dtype == np.float64
+            np.testing.assert_allclose(result['eigenvalues'], ev, atol=1e-8)
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
 